@@ -1,15 +1,38 @@
+from functools import lru_cache
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from config import get_settings
 
-settings = get_settings()
 
-SQLALCHEMY_DATABASE_URL = (
-    "postgresql://"
-    f"{settings.database_username}:{settings.database_password}"
-    "@127.0.0.1:5432/fastapi_ca"
-)
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_database_url():
+    settings = get_settings()
+
+    return (
+        "postgresql://"
+        f"{settings.database_username}:{settings.database_password}"
+        "@127.0.0.1:5432/fastapi_ca"
+    )
+
+
+# 엔진은 첫 세션 요청 시점에 생성 (import 시 설정 로딩/다이얼렉트 초기화 비용 제거)
+@lru_cache(maxsize=1)
+def get_engine():
+    return create_engine(
+        get_database_url(),
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=1800,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def SessionLocal():
+    return get_sessionmaker()()
+
 
 Base = declarative_base()
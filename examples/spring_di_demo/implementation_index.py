@@ -0,0 +1,55 @@
+"""
+인터페이스(상위 타입) -> 구현체 역색인
+ApplicationContext / OptimizedApplicationContext 공용
+"""
+
+from typing import Iterable, Type
+
+
+class ImplementationIndexMixin:
+    """등록 시점에 MRO로 구현체를 색인하고, 색인에 없으면 issubclass로 찾는 믹스인
+
+    사용하는 클래스는 _impls_by_base(dict), _runtime_protocols(set) 클래스 속성과
+    등록된 컴포넌트 타입을 돌려주는 _registered_types()를 제공해야 한다.
+    """
+
+    @classmethod
+    def _registered_types(cls) -> Iterable[Type]:
+        raise NotImplementedError
+
+    @classmethod
+    def _index_implementation(cls, component_type: Type):
+        """구현체 색인에 추가 (일반 Protocol은 issubclass를 지원하지 않으므로 MRO 사용)"""
+        for base in component_type.__mro__[1:]:
+            if base is not object:
+                cls._impls_by_base.setdefault(base, []).append(component_type)
+
+        # 이미 조회된 런타임 Protocol은 구조적 일치 여부를 등록 시점에 반영
+        for protocol in cls._runtime_protocols:
+            if protocol not in component_type.__mro__ and issubclass(component_type, protocol):
+                cls._impls_by_base[protocol].append(component_type)
+
+    @classmethod
+    def _find_implementations(cls, interface_type: Type) -> list:
+        """인터페이스의 구현체 찾기 (등록 시점에 만든 색인 조회)"""
+        implementations = cls._impls_by_base.get(interface_type)
+        if implementations is not None:
+            return implementations
+
+        # 색인에 없으면 issubclass로 검사: 런타임 Protocol(구조적 일치), ABC.register 가상 서브클래스
+        try:
+            implementations = [
+                component_type for component_type in cls._registered_types()
+                if issubclass(component_type, interface_type)
+            ]
+        except TypeError:
+            # 일반 Protocol 등 issubclass를 지원하지 않는 타입
+            return []
+
+        # 런타임 Protocol은 결과를 색인에 두고 이후 등록 시 갱신
+        # (ABC 가상 서브클래스는 register가 나중에 호출될 수 있으므로 캐시하지 않음)
+        if getattr(interface_type, '_is_runtime_protocol', False):
+            cls._runtime_protocols.add(interface_type)
+            cls._impls_by_base[interface_type] = implementations
+
+        return implementations
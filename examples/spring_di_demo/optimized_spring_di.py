@@ -3,16 +3,22 @@
 성능 개선과 안정성 강화 버전
 """
 
-import inspect
 import threading
+import typing
 import weakref
-from typing import Dict, Type, Any, get_type_hints, Optional, Set
-from functools import lru_cache, wraps
+from typing import Dict, Type, Any, Optional, Set
+from functools import wraps
 from enum import Enum
 import warnings
 from collections import defaultdict
 import time
 
+try:
+    from .implementation_index import ImplementationIndexMixin
+except ImportError:
+    # 패키지가 아닌 단독 모듈로 import된 경우 (tests 등에서 sys.path로 로딩)
+    from implementation_index import ImplementationIndexMixin
+
 class Scope(Enum):
     SINGLETON = "singleton"
     PROTOTYPE = "prototype"
@@ -27,65 +33,140 @@ class CircularDependencyError(Exception):
 class BeanNotFoundError(Exception):
     """빈을 찾을 수 없음 에러"""
     def __init__(self, bean_type: Type):
-        super().__init__(f"No bean found for type: {bean_type.__name__}")
+        # 해결되지 않은 전방 참조는 문자열로 전달됨
+        type_name = getattr(bean_type, '__name__', bean_type)
+        super().__init__(f"No bean found for type: {type_name}")
+
+# 싱글톤 조회 실패 표시 (None/빈 컨테이너 같은 falsy 빈과 구분)
+_MISSING = object()
 
-class OptimizedApplicationContext:
+class OptimizedApplicationContext(ImplementationIndexMixin):
     """성능 최적화된 ApplicationContext"""
 
-    # 인스턴스 저장 (WeakReference 사용으로 메모리 누수 방지)
-    _instances: Dict[Type, Any] = {}
-    _component_configs: Dict[Type, dict] = {}
+    # 컴포넌트 설정 (속성별 dict로 분리: scope만 필요한 경로는 dict 하나만 조회)
+    _scope: Dict[Type, Scope] = {}
+    _primary: Dict[Type, bool] = {}
+    _builders: Dict[Type, Any] = {}
+
+    # 싱글톤 인스턴스 저장 (get_bean 빠른 경로에서 직접 조회)
+    _singletons: Dict[Type, Any] = {}
 
     # 성능 최적화: 의존성 그래프 캐싱
     _dependency_cache: Dict[Type, Dict[str, Type]] = {}
     _creation_order_cache: Dict[Type, list] = {}
 
+    # 인터페이스(상위 타입) -> 구현체 역색인
+    _impls_by_base: Dict[Type, list] = {}
+    _runtime_protocols: Set[Type] = set()
+
+    # 전방 참조(문자열 어노테이션) 해결 결과
+    _forward_refs: Dict[str, Type] = {}
+    _forward_ref_warned: Set[str] = set()
+    _hints_checked: Set[Type] = set()  # 생성자 어노테이션 평가를 시도한 컴포넌트
+
+    # 사전 계산된 생성 계획 (토폴로지 정렬 결과)
+    _plan: Dict[Type, tuple] = {}
+    _build_order: list = []
+    _resolved_args: Dict[Type, Dict[str, Any]] = {}
+
     # 안정성: 순환 의존성 감지
     _creation_stack: Set[Type] = set()
-    _lock = threading.RLock()  # 재진입 가능 락
+    _building: Set[Type] = set()  # 생성 중인 싱글톤 (_lock으로 보호)
+    _lock = threading.RLock()  # 재진입 가능 락 (생성 경로에서만 사용)
 
-    # 메트릭 수집
-    _metrics = defaultdict(lambda: {'creation_count': 0, 'total_time': 0})
+    # 메트릭 수집 (기본 비활성화: 빠른 경로에 관측 비용을 남기지 않음)
+    _creation_counts: Dict[Type, int] = {}
+    _creation_time_ns: Dict[Type, int] = {}
+    _metrics_enabled = False
 
     @classmethod
     def register_component(cls, component_type: Type, scope: Scope = Scope.SINGLETON, primary: bool = False):
         """컴포넌트 등록 최적화"""
         with cls._lock:
-            cls._component_configs[component_type] = {
-                'scope': scope,
-                'primary': primary,
-                'instance': None
-            }
+            if component_type not in cls._scope:
+                cls._index_implementation(component_type)
+
+            cls._scope[component_type] = scope
+            cls._primary[component_type] = primary
+            # 재등록 시 이전 싱글톤을 버려 새 스코프/설정이 바로 반영되도록 함
+            cls._singletons.pop(component_type, None)
+            # 고정된 인자는 다른 컴포넌트의 이전 싱글톤을 참조할 수 있으므로 전부 무효화
+            cls._resolved_args.clear()
+            cls._forward_refs.pop(component_type.__name__, None)
+            cls._hints_checked.discard(component_type)
             # 의존성 사전 분석 및 캐싱
-            cls._analyze_dependencies(component_type)
+            dependencies = cls._analyze_dependencies(component_type)
+            # 생성자 호출을 전용 빌더 함수로 사전 컴파일
+            cls._builders[component_type] = cls._compile_builder(component_type, dependencies)
 
     @classmethod
-    @lru_cache(maxsize=1000)  # 타입 분석 결과 캐싱
     def _analyze_dependencies(cls, component_type: Type) -> Dict[str, Type]:
         """의존성 사전 분석 (성능 최적화)"""
         if component_type in cls._dependency_cache:
             return cls._dependency_cache[component_type]
 
-        constructor = component_type.__init__
-        signature = inspect.signature(constructor)
-        dependencies = {}
-
-        for param_name, param in signature.parameters.items():
-            if param_name == 'self':
-                continue
-            if param.annotation != inspect.Parameter.empty:
-                dependencies[param_name] = param.annotation
+        # inspect.signature 대신 생성자 어노테이션을 직접 읽음 (Parameter 객체 생성 비용 제거)
+        annotations = getattr(component_type.__init__, '__annotations__', {})
+        dependencies = {
+            param_name: param_type
+            for param_name, param_type in annotations.items()
+            if param_name != 'return'
+        }
 
         cls._dependency_cache[component_type] = dependencies
         return dependencies
 
+    @classmethod
+    def _dependencies_of(cls, component_type: Type) -> Dict[str, Type]:
+        """문자열 어노테이션을 정의 모듈 기준으로 평가한 의존성 반환 (컴포넌트당 최초 1회)"""
+        # clear_cache() 후에는 캐시가 비어 있으므로 다시 분석
+        dependencies = cls._analyze_dependencies(component_type)
+        if component_type in cls._hints_checked:
+            return dependencies
+        cls._hints_checked.add(component_type)
+
+        if any(isinstance(param_type, str) for param_type in dependencies.values()):
+            try:
+                hints = typing.get_type_hints(component_type.__init__)
+            except Exception as e:
+                # 지역 클래스 등 모듈 전역에서 찾을 수 없으면 이름 매칭(_resolve_forward_ref)으로 대체
+                warnings.warn(
+                    f"Could not evaluate annotations of {component_type.__name__} ({e}); "
+                    f"falling back to name matching"
+                )
+            else:
+                dependencies = {
+                    param_name: hints.get(param_name, param_type)
+                    for param_name, param_type in dependencies.items()
+                }
+                cls._dependency_cache[component_type] = dependencies
+                cls._builders[component_type] = cls._compile_builder(component_type, dependencies)
+
+        return dependencies
+
     @classmethod
     def get_bean(cls, bean_type: Type, _creation_path: Optional[list] = None) -> Any:
         """최적화된 빈 인스턴스 반환"""
+        # 빠른 경로: 이미 생성된 싱글톤은 락/메트릭 없이 바로 반환
+        # (GIL 하에서 dict 읽기/단일 대입은 원자적이므로 완성된 객체만 보임)
+        try:
+            return cls._singletons[bean_type]
+        except KeyError:
+            pass
+
+        if isinstance(bean_type, str):
+            # 전방 참조는 최초 해결 시점에 등록된 타입으로 변환
+            resolved_type = cls._resolve_forward_ref(bean_type)
+            if resolved_type is None:
+                raise BeanNotFoundError(bean_type)
+            return cls.get_bean(resolved_type, _creation_path)
+
         if _creation_path is None:
             _creation_path = []
 
-        start_time = time.perf_counter()
+        metrics_enabled = cls._metrics_enabled
+        if metrics_enabled:
+            start_ns = time.perf_counter_ns()
 
         with cls._lock:
             # 순환 의존성 감지
@@ -94,37 +175,60 @@ class OptimizedApplicationContext:
                 raise CircularDependencyError(cycle)
 
             # 빈 설정 확인
-            config = cls._component_configs.get(bean_type)
-            if not config:
+            scope = cls._scope.get(bean_type)
+            if scope is None:
                 # 인터페이스 구현체 찾기
                 implementations = cls._find_implementations(bean_type)
                 if implementations:
                     bean_type = implementations[0]
-                    config = cls._component_configs.get(bean_type)
+                    scope = cls._scope.get(bean_type)
 
-                if not config:
+                if scope is None:
                     raise BeanNotFoundError(bean_type)
 
-            # 싱글톤 인스턴스 반환 (성능 최적화)
-            if config['scope'] == Scope.SINGLETON and config['instance']:
-                return config['instance']
+            if scope == Scope.SINGLETON:
+                # 락 획득 후 재확인 (인터페이스로 요청됐거나 다른 스레드가 먼저 생성한 경우)
+                instance = cls._singletons.get(bean_type, _MISSING)
+                if instance is not _MISSING:
+                    return instance
+
+                if bean_type in cls._building:
+                    raise CircularDependencyError(_creation_path + [bean_type])
 
-            # 새 인스턴스 생성
-            instance = cls._create_instance_optimized(bean_type, _creation_path + [bean_type])
+                cls._building.add(bean_type)
+                try:
+                    instance = cls._create_instance_optimized(bean_type, _creation_path + [bean_type])
+                finally:
+                    cls._building.discard(bean_type)
 
-            # 싱글톤 캐싱
-            if config['scope'] == Scope.SINGLETON:
-                config['instance'] = instance
+                # 완성된 인스턴스를 단일 대입으로 공개
+                cls._singletons[bean_type] = instance
+            else:
+                instance = cls._create_instance_optimized(bean_type, _creation_path + [bean_type])
 
-            # 메트릭 업데이트
-            cls._metrics[bean_type]['creation_count'] += 1
-            cls._metrics[bean_type]['total_time'] += time.perf_counter() - start_time
+        # 메트릭 업데이트 (활성화된 경우, 생성이 일어난 느린 경로에서만)
+        if metrics_enabled:
+            cls._creation_counts[bean_type] = cls._creation_counts.get(bean_type, 0) + 1
+            cls._creation_time_ns[bean_type] = cls._creation_time_ns.get(bean_type, 0) + time.perf_counter_ns() - start_ns
 
-            return instance
+        return instance
 
     @classmethod
     def _create_instance_optimized(cls, component_type: Type, creation_path: list) -> Any:
         """최적화된 인스턴스 생성"""
+        resolved_args = cls._resolved_args.get(component_type)
+        if resolved_args is not None:
+            # prepare()에서 고정된 싱글톤 인자: dict 조회 없이 바로 생성
+            return component_type(**resolved_args)
+
+        if component_type not in cls._hints_checked:
+            cls._dependencies_of(component_type)
+
+        builder = cls._builders.get(component_type)
+        if builder is not None:
+            # 사전 컴파일된 빌더: 싱글톤 의존성은 dict 조회, 나머지는 get_bean
+            return builder(cls._singletons, cls.get_bean, creation_path)
+
         # 캐시된 의존성 정보 사용
         dependencies_info = cls._dependency_cache.get(component_type, {})
 
@@ -140,80 +244,260 @@ class OptimizedApplicationContext:
         return component_type(**resolved_dependencies)
 
     @classmethod
-    def _find_implementations(cls, interface_type: Type) -> list:
-        """인터페이스 구현체 찾기 (캐싱 추가)"""
-        implementations = []
-        for component_type in cls._component_configs.keys():
-            # MRO(Method Resolution Order) 검사
-            if issubclass(component_type, interface_type) and component_type != interface_type:
-                implementations.append(component_type)
-        return implementations
+    def _compile_builder(cls, component_type: Type, dependencies: Dict[str, Type]):
+        """의존성 조회를 인라인한 생성자 클로저 생성 (런타임 코드 생성)
+
+        생성 코드 예: def _build(S, get, path, cls=cls, M=M, D0=A):
+                         s = S.get
+                         v0 = s(D0, M)
+                         if v0 is M: v0 = get(D0, path)
+                         return cls(a=v0)
+        """
+        namespace = {'cls': component_type, 'M': _MISSING}
+        defaults = ['cls=cls', 'M=M']
+        lookups = []
+        arguments = []
+
+        for index, (param_name, param_type) in enumerate(dependencies.items()):
+            name = f"D{index}"
+            namespace[name] = param_type
+            defaults.append(f"{name}={name}")
+            lookups.append(f"    v{index} = s({name}, M)\n")
+            lookups.append(f"    if v{index} is M: v{index} = get({name}, path)\n")
+            arguments.append(f"{param_name}=v{index}")
+
+        source = (
+            f"def _build(S, get, path, {', '.join(defaults)}):\n"
+            f"    s = S.get\n"
+            + "".join(lookups) +
+            f"    return cls({', '.join(arguments)})\n"
+        )
+        exec(source, namespace)
+        return namespace['_build']
+
+    @classmethod
+    def _registered_types(cls):
+        return cls._scope
+
+    @classmethod
+    def _resolve_type(cls, param_type) -> Optional[Type]:
+        """의존성 타입을 실제 등록된 컴포넌트 타입으로 해결 (없으면 None)"""
+        if isinstance(param_type, str):
+            return cls._resolve_forward_ref(param_type)
+        if param_type in cls._scope:
+            return param_type
+        implementations = cls._find_implementations(param_type)
+        return implementations[0] if implementations else None
+
+    @classmethod
+    def _resolve_forward_ref(cls, type_name: str) -> Optional[Type]:
+        """평가할 수 없었던 문자열 어노테이션을 등록된 컴포넌트 이름으로 해결 (이름당 한 번만 경고)"""
+        resolved_type = cls._forward_refs.get(type_name)
+        if resolved_type is not None:
+            return resolved_type
+
+        matches = [component_type for component_type in cls._scope if component_type.__name__ == type_name]
+        if len(matches) == 1:
+            cls._forward_refs[type_name] = matches[0]
+            return matches[0]
+
+        if type_name not in cls._forward_ref_warned:
+            cls._forward_ref_warned.add(type_name)
+            reason = "ambiguous" if matches else "not registered"
+            warnings.warn(f"Forward reference '{type_name}' could not be resolved ({reason})")
+        return None
+
+    @classmethod
+    def _compile_plan(cls):
+        """의존성 그래프를 토폴로지 정렬(Kahn)하여 생성 계획 수립"""
+        plan = {}
+        dependents = defaultdict(list)
+        in_degree = {}
+
+        for component_type in cls._scope:
+            params = []
+            in_degree[component_type] = 0
+            for param_name, param_type in cls._dependencies_of(component_type).items():
+                resolved_type = cls._resolve_type(param_type)
+                params.append((param_name, resolved_type))
+                if resolved_type is not None:
+                    dependents[resolved_type].append(component_type)
+                    in_degree[component_type] += 1
+            plan[component_type] = (component_type, tuple(params))
+
+        queue = [component_type for component_type, degree in in_degree.items() if degree == 0]
+        build_order = []
+        while queue:
+            component_type = queue.pop()
+            build_order.append(component_type)
+            for dependent in dependents[component_type]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        # 순환에 포함된 컴포넌트는 build_order에서 빠지며 get_bean 시점에 에러 발생
+        cls._plan = plan
+        cls._build_order = build_order
+
+    @classmethod
+    def prepare(cls):
+        """생성 계획에 따라 모든 싱글톤을 미리 생성"""
+        with cls._lock:
+            cls._compile_plan()
+            deferred = set()
+
+            for component_type in cls._build_order:
+                _, params = cls._plan[component_type]
+                # 해결되지 않은 의존성이 있으면 get_bean 시점으로 미룸
+                if any(resolved_type is None or resolved_type in deferred for _, resolved_type in params):
+                    deferred.add(component_type)
+                    continue
+
+                if cls._scope[component_type] != Scope.SINGLETON:
+                    continue
+                if component_type in cls._singletons:
+                    continue
+
+                cls.get_bean(component_type)
+
+            # 의존성이 모두 생성된 싱글톤이면 인자를 인스턴스 참조로 고정
+            cls._resolved_args = {}
+            for component_type, (_, params) in cls._plan.items():
+                if all(resolved_type in cls._singletons for _, resolved_type in params):
+                    cls._resolved_args[component_type] = {
+                        param_name: cls._singletons[resolved_type]
+                        for param_name, resolved_type in params
+                    }
+
+    @classmethod
+    def reset_singletons(cls):
+        """생성된 싱글톤과 이를 참조하는 고정 인자를 모두 폐기"""
+        with cls._lock:
+            cls._singletons.clear()
+            cls._resolved_args.clear()
+
+    @classmethod
+    def enable_metrics(cls):
+        """메트릭 수집 활성화"""
+        cls._metrics_enabled = True
+
+    @classmethod
+    def disable_metrics(cls):
+        """메트릭 수집 비활성화"""
+        cls._metrics_enabled = False
 
     @classmethod
     def get_metrics(cls) -> dict:
-        """성능 메트릭 반환"""
-        return dict(cls._metrics)
+        """성능 메트릭 반환 (생성 횟수/누적 시간(초)을 타입별로 합쳐서 반환)"""
+        return {
+            component_type: {
+                'creation_count': count,
+                'total_time': cls._creation_time_ns.get(component_type, 0) / 1e9,
+            }
+            for component_type, count in cls._creation_counts.items()
+        }
 
     @classmethod
     def clear_cache(cls):
-        """캐시 초기화"""
+        """캐시 초기화 (빌더는 유지: 의존성은 다음 조회 때 같은 어노테이션에서 다시 분석됨)"""
         cls._dependency_cache.clear()
+        cls._hints_checked.clear()
         cls._creation_order_cache.clear()
-        cls._analyze_dependencies.cache_clear()
+        cls._plan.clear()
+        cls._build_order.clear()
+        cls._resolved_args.clear()
 
     @classmethod
     def validate_configuration(cls) -> list:
         """설정 검증 및 잠재적 문제 감지"""
         issues = []
 
-        # 순환 의존성 사전 검사
-        for component_type in cls._component_configs.keys():
-            try:
-                cls._detect_circular_dependencies(component_type, set())
-            except CircularDependencyError as e:
-                issues.append(f"Circular dependency: {e.cycle_path}")
+        # 순환 의존성 사전 검사 (SCC 하나당 한 번만 보고)
+        for cycle in cls._find_cycles():
+            issues.append(f"Circular dependency: {cycle}")
 
         # 미해결 의존성 검사
-        for component_type, deps in cls._dependency_cache.items():
-            for param_name, param_type in deps.items():
-                if param_type not in cls._component_configs:
-                    implementations = cls._find_implementations(param_type)
-                    if not implementations:
-                        issues.append(f"Unresolved dependency: {component_type.__name__} -> {param_type.__name__}")
+        for component_type in list(cls._scope):
+            for param_name, param_type in cls._dependencies_of(component_type).items():
+                if cls._resolve_type(param_type) is None:
+                    type_name = getattr(param_type, '__name__', param_type)
+                    issues.append(f"Unresolved dependency: {component_type.__name__} -> {type_name}")
 
         return issues
 
     @classmethod
-    def _detect_circular_dependencies(cls, component_type: Type, visited: Set[Type], path: Optional[list] = None):
-        """순환 의존성 사전 감지"""
-        if path is None:
-            path = []
-
-        if component_type in visited:
-            cycle_start = path.index(component_type)
-            cycle = path[cycle_start:] + [component_type]
-            raise CircularDependencyError(cycle)
-
-        visited.add(component_type)
-        path.append(component_type)
+    def _find_cycles(cls) -> list:
+        """Tarjan SCC로 순환 의존성 탐지 (반복 DFS, 간선당 복사 없음)"""
+        graph = {}
+        for component_type in cls._scope:
+            edges = []
+            for param_type in cls._dependencies_of(component_type).values():
+                resolved_type = cls._resolve_type(param_type)
+                if resolved_type is not None:
+                    edges.append(resolved_type)
+            graph[component_type] = edges
+
+        index_of = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        cycles = []
+        next_index = 0
+
+        for root in graph:
+            if root in index_of:
+                continue
 
-        dependencies = cls._dependency_cache.get(component_type, {})
-        for param_type in dependencies.values():
-            if param_type in cls._component_configs:
-                cls._detect_circular_dependencies(param_type, visited.copy(), path.copy())
+            index_of[root] = lowlink[root] = next_index
+            next_index += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
+
+            while work:
+                node, edges = work[-1]
+                advanced = False
+                for target in edges:
+                    if target not in index_of:
+                        index_of[target] = lowlink[target] = next_index
+                        next_index += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(graph[target])))
+                        advanced = True
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[target])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member is node:
+                            break
+                    # 크기 2 이상의 SCC 또는 자기 자신을 참조하는 경우가 순환
+                    if len(component) > 1 or node in graph[node]:
+                        component.reverse()
+                        cycles.append(component + [component[0]])
+
+        return cycles
 
 # 최적화된 데코레이터들
 
 def component(scope: Scope = Scope.SINGLETON, primary: bool = False):
     """최적화된 @component 데코레이터"""
     def decorator(cls):
-        # 타입 힌트 사전 검증
-        try:
-            get_type_hints(cls.__init__)
-        except Exception as e:
-            warnings.warn(f"Type hint analysis failed for {cls.__name__}: {e}")
-
         # 메타클래스 없이 직접 등록 (성능 향상)
+        # 타입 힌트는 여기서 평가하지 않음: 전방 참조는 최초 해결 시점에 처리
         OptimizedApplicationContext.register_component(cls, scope, primary)
 
         # 원본 클래스 반환 (메모리 효율성)
@@ -221,17 +505,8 @@ def component(scope: Scope = Scope.SINGLETON, primary: bool = False):
 
     return decorator
 
-def service(scope: Scope = Scope.SINGLETON):
-    """최적화된 @service 데코레이터"""
-    return component(scope=scope)
-
-def repository(scope: Scope = Scope.SINGLETON):
-    """최적화된 @repository 데코레이터"""
-    return component(scope=scope)
-
-def controller(scope: Scope = Scope.SINGLETON):
-    """최적화된 @controller 데코레이터"""
-    return component(scope=scope)
+# @service / @repository / @controller는 component의 별칭 (추가 팩토리 프레임 없음)
+service = repository = controller = component
 
 # 성능 모니터링 데코레이터
 def monitored_component(scope: Scope = Scope.SINGLETON):
@@ -262,21 +537,25 @@ def get_component(component_type: Type):
 
 # 개발자 도구
 class DIProfiler:
-    """DI 시스템 프로파일러"""
+    """DI 시스템 프로파일러 (출력은 문자열로 모아 한 번에 print)"""
 
     @staticmethod
     def print_metrics():
         """성능 메트릭 출력"""
         metrics = OptimizedApplicationContext.get_metrics()
 
-        print("📊 DI System Performance Metrics")
-        print("=" * 50)
+        lines = ["📊 DI System Performance Metrics", "=" * 50]
+
+        if not OptimizedApplicationContext._metrics_enabled:
+            lines.append("(metrics disabled - call OptimizedApplicationContext.enable_metrics() to collect)")
 
         for component_type, data in metrics.items():
             avg_time = data['total_time'] / data['creation_count'] if data['creation_count'] else 0
-            print(f"{component_type.__name__:<30} "
-                  f"Created: {data['creation_count']:>3} "
-                  f"Avg Time: {avg_time*1000:>6.2f}ms")
+            lines.append(f"{component_type.__name__:<30} "
+                         f"Created: {data['creation_count']:>3} "
+                         f"Avg Time: {avg_time*1000:>6.2f}ms")
+
+        print("\n".join(lines))
 
     @staticmethod
     def validate_system():
@@ -286,18 +565,18 @@ class DIProfiler:
         if not issues:
             print("✅ DI System validation passed!")
         else:
-            print("⚠️ DI System issues found:")
-            for issue in issues:
-                print(f"  - {issue}")
+            lines = ["⚠️ DI System issues found:"]
+            lines.extend(f"  - {issue}" for issue in issues)
+            print("\n".join(lines))
 
     @staticmethod
     def dependency_graph():
         """의존성 그래프 출력"""
-        print("🔗 Dependency Graph")
-        print("=" * 30)
-
+        lines = ["🔗 Dependency Graph", "=" * 30]
         for component_type, deps in OptimizedApplicationContext._dependency_cache.items():
-            print(f"{component_type.__name__}")
+            lines.append(f"{component_type.__name__}")
             for param_name, param_type in deps.items():
-                print(f"  └─ {param_name}: {param_type.__name__}")
-            print()
\ No newline at end of file
+                lines.append(f"  └─ {param_name}: {getattr(param_type, '__name__', param_type)}")
+            lines.append("")
+
+        print("\n".join(lines))
@@ -1,6 +1,6 @@
 """
 Spring Boot 수준의 자동 의존성 주입 시스템
-메타클래스와 데코레이터를 활용한 완전 자동화
+데코레이터를 활용한 완전 자동화
 """
 
 import inspect
@@ -9,31 +9,31 @@ from functools import wraps
 from enum import Enum
 import threading
 
+try:
+    from .implementation_index import ImplementationIndexMixin
+except ImportError:
+    # 패키지가 아닌 단독 모듈로 import된 경우 (tests 등에서 sys.path로 로딩)
+    from implementation_index import ImplementationIndexMixin
+
 class Scope(Enum):
     SINGLETON = "singleton"
     PROTOTYPE = "prototype"
 
-class ComponentMeta(type):
-    """컴포넌트 메타클래스 - 클래스 생성시 자동 등록"""
-    def __new__(mcs, name, bases, namespace, **kwargs):
-        cls = super().__new__(mcs, name, bases, namespace)
-
-        # @component 데코레이터가 적용된 경우에만 등록
-        if hasattr(cls, '_is_component'):
-            ApplicationContext.register_component(cls)
-
-        return cls
-
-class ApplicationContext:
+class ApplicationContext(ImplementationIndexMixin):
     """Spring의 ApplicationContext 역할"""
     _components: Dict[Type, Any] = {}
     _component_configs: Dict[Type, dict] = {}
-    _lock = threading.Lock()
+    _impls_by_base: Dict[Type, list] = {}  # 인터페이스(상위 타입) -> 구현체 (등록 시점에 색인)
+    _runtime_protocols: set = set()
+    _lock = threading.RLock()  # get_bean이 의존성 해결 중 재귀 호출되므로 재진입 가능 락
 
     @classmethod
     def register_component(cls, component_type: Type, scope: Scope = Scope.SINGLETON, primary: bool = False):
         """컴포넌트 등록"""
         with cls._lock:
+            if component_type not in cls._component_configs:
+                cls._index_implementation(component_type)
+
             cls._component_configs[component_type] = {
                 'scope': scope,
                 'primary': primary,
@@ -67,6 +67,13 @@ class ApplicationContext:
 
             return instance
 
+    @classmethod
+    def reset_singletons(cls):
+        """생성된 싱글톤 인스턴스를 모두 폐기 (등록 정보는 유지)"""
+        with cls._lock:
+            for config in cls._component_configs.values():
+                config['instance'] = None
+
     @classmethod
     def _create_instance(cls, component_type: Type) -> Any:
         """의존성 자동 주입으로 인스턴스 생성"""
@@ -86,48 +93,42 @@ class ApplicationContext:
         return component_type(**dependencies)
 
     @classmethod
-    def _find_implementations(cls, interface_type: Type) -> list:
-        """인터페이스의 구현체 찾기"""
-        implementations = []
-        for component_type in cls._component_configs.keys():
-            if interface_type in component_type.__mro__:
-                implementations.append(component_type)
-        return implementations
+    def _registered_types(cls):
+        return cls._component_configs
 
     @classmethod
     def scan_and_autowire(cls):
-        """모든 등록된 컴포넌트의 @Autowired 필드 처리"""
-        for component_type, config in cls._component_configs.items():
+        """이미 생성된 싱글톤의 @Autowired 필드를 미리 주입 (인스턴스 생성은 lazy 유지)"""
+        for config in list(cls._component_configs.values()):
             if config['instance']:
                 cls._process_autowired_fields(config['instance'])
 
     @classmethod
     def _process_autowired_fields(cls, instance):
         """@Autowired 필드에 의존성 주입"""
-        for attr_name in dir(instance):
-            attr = getattr(instance, attr_name)
-            if hasattr(attr, '_autowired'):
-                field_type = attr._autowired_type
-                setattr(instance, attr_name, cls.get_bean(field_type))
+        # getattr(instance) 대신 클래스 __dict__를 직접 읽어 주입 대상만 골라냄
+        instance_dict = getattr(instance, '__dict__', {})
+        seen = set()
+        for klass in type(instance).__mro__:
+            for attr_name, attr in klass.__dict__.items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+
+                if isinstance(attr, AutowiredDescriptor):
+                    # 디스크립터가 주입/캐시를 담당 (이미 주입된 경우 캐시된 값이 반환됨)
+                    getattr(instance, attr_name)
+                elif getattr(attr, '_autowired', False) and attr_name not in instance_dict:
+                    setattr(instance, attr_name, cls.get_bean(attr._autowired_type))
 
 # 데코레이터들 - Spring Boot 스타일!
 
 def component(scope: Scope = Scope.SINGLETON, primary: bool = False):
     """@Component - 범용 컴포넌트"""
     def decorator(cls):
-        cls._is_component = True
-        cls._scope = scope
-        cls._primary = primary
-
-        # 메타클래스 적용
-        class ComponentClass(cls, metaclass=ComponentMeta):
-            pass
-
-        ComponentClass.__name__ = cls.__name__
-        ComponentClass.__qualname__ = cls.__qualname__
-
-        ApplicationContext.register_component(ComponentClass, scope, primary)
-        return ComponentClass
+        # 메타클래스/서브클래스 없이 원본 클래스를 직접 등록
+        ApplicationContext.register_component(cls, scope, primary)
+        return cls
 
     return decorator
 
@@ -144,27 +145,42 @@ def controller(scope: Scope = Scope.SINGLETON):
     return component(scope=scope)
 
 class AutowiredDescriptor:
-    """@Autowired 필드 디스크립터"""
+    """@Autowired 필드 디스크립터
+
+    non-data 디스크립터로 동작하므로 한 번 주입된 값은 인스턴스 속성이 되어
+    이후 접근은 디스크립터를 거치지 않는 일반 속성 조회가 된다.
+    __dict__가 없는 __slots__ 클래스는 '_<필드명>' 슬롯이 있으면 그곳에 캐시한다.
+    """
     def __init__(self, field_type: Type):
         self.field_type = field_type
         self.field_name = None
+        self.slot_name = None
 
     def __set_name__(self, owner, name):
-        self.field_name = f"_{name}"
+        self.field_name = name
+        self.slot_name = f"_{name}"
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        if not hasattr(instance, self.field_name):
-            # lazy 주입
-            value = ApplicationContext.get_bean(self.field_type)
-            setattr(instance, self.field_name, value)
-
-        return getattr(instance, self.field_name)
-
-    def __set__(self, instance, value):
-        setattr(instance, self.field_name, value)
+        if not hasattr(instance, '__dict__'):
+            try:
+                return getattr(instance, self.slot_name)
+            except AttributeError:
+                pass
+
+        # lazy 주입 (scan_and_autowire로 미리 주입되지 않은 경우)
+        value = ApplicationContext.get_bean(self.field_type)
+        try:
+            if hasattr(instance, '__dict__'):
+                setattr(instance, self.field_name, value)
+            else:
+                object.__setattr__(instance, self.slot_name, value)
+        except AttributeError:
+            # 캐시할 슬롯이 없으면 매번 get_bean으로 조회 (싱글톤은 dict 조회 한 번)
+            pass
+        return value
 
 def autowired(field_type: Type):
     """@Autowired - 자동 주입 필드"""
@@ -19,14 +19,18 @@ def get_crypto():
 def get_ulid():
     return ULID()
 
-# 2. 리포지토리 팩토리
+# 2. 리포지토리 팩토리 (무상태이므로 싱글톤으로 캐싱)
+@lru_cache()
 def get_user_repository():
     return UserRepository()
 
 # 3. 서비스 팩토리
+@lru_cache()
 def get_email_service():
     return EmailService()
 
+# 하위 의존성이 모두 캐싱되므로 같은 인자로 호출되어 싱글톤처럼 동작
+@lru_cache()
 def get_user_service(
     user_repo: UserRepository = Depends(get_user_repository),
     email_service: EmailService = Depends(get_email_service),
@@ -42,8 +46,12 @@ def get_user_service(
     )
 
 # 4. 타입 앨리어스 - 이게 레전드급!
-UserServiceDep = Annotated[UserService, Depends(get_user_service)]
-UserRepoDep = Annotated[UserRepository, Depends(get_user_repository)]
+# Depends 객체를 모듈 상수로 두고 모든 Annotated에서 공유
+_USER_SERVICE_DEP = Depends(get_user_service)
+_USER_REPO_DEP = Depends(get_user_repository)
+
+UserServiceDep = Annotated[UserService, _USER_SERVICE_DEP]
+UserRepoDep = Annotated[UserRepository, _USER_REPO_DEP]
 
 # 5. 컨트롤러에서 사용 - 매우 깔끔!
 """
@@ -1 +0,0 @@
-# Spring DI Tests
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+DI 컨텍스트 격리 헬퍼
+테스트/벤치마크마다 ApplicationContext 클래스 상태를 비운 상태로 교체하고 종료 시 복원
+"""
+
+import contextlib
+
+
+def context_state_names(ctx):
+    """컨텍스트 클래스가 직접 정의한 상태 속성 이름 (컨테이너/플래그만, 락 등은 제외)
+
+    목록을 손으로 관리하지 않고 클래스 정의에서 읽으므로 상태가 추가돼도 따라간다.
+    """
+    return tuple(
+        name for name, value in vars(ctx).items()
+        if not name.startswith('__') and isinstance(value, (dict, set, list, bool))
+    )
+
+
+@contextlib.contextmanager
+def fresh_context(ctx):
+    """빈 상태로 교체한 뒤 종료 시 원래 객체를 그대로 되돌림"""
+    snapshot = {name: getattr(ctx, name) for name in context_state_names(ctx)}
+    for name, value in snapshot.items():
+        setattr(ctx, name, type(value)())
+    try:
+        yield ctx
+    finally:
+        for name, value in snapshot.items():
+            setattr(ctx, name, value)
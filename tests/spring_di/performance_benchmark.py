@@ -3,11 +3,14 @@ DI 시스템 성능 벤치마크 테스트
 성능, 메모리 사용량, 확장성 분석
 """
 
+import contextlib
 import time
 import sys
 import os
 import tracemalloc
+import statistics
 import gc
+from concurrent.futures import ProcessPoolExecutor
 from typing import Protocol
 
 # 경로 추가
@@ -17,6 +20,7 @@ from spring_di import (
     service, repository, controller, component, autowired,
     ApplicationContext, Scope
 )
+from context_isolation import fresh_context
 
 # dependency-injector와 비교
 try:
@@ -29,32 +33,112 @@ except ImportError:
 # FastAPI 기본 Depends와 비교
 from fastapi import Depends
 
-class PerformanceBenchmark:
+# 컴파일된 루프 하한선 측정 (선택 의존성, 없으면 일반 파이썬 함수로 동작)
+try:
+    import numba
+    njit = numba.njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True)
+def _manual_loop(n):
+    """DI 오버헤드가 전혀 없는 순수 반복 (컴파일된 코드 기준 하한선)"""
+    s = 0
+    for _ in range(n):
+        s += 1
+    return s
+
+# 결과 후처리용 구조화 배열 (선택 의존성, 없으면 리스트 연산으로 대체)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-    def __init__(self):
-        self.results = {}
+_RESULT_DTYPE = [('name', 'U32'), ('tpi', 'f8'), ('total', 'f8'), ('mem', 'f8')]
+
+# 결과 dict 키 (모든 벤치마크 결과가 같은 문자열 객체를 공유)
+_KEYS = tuple(sys.intern(k) for k in (
+    'iterations', 'time_per_iteration', 'total_time', 'memory_current', 'memory_peak',
+))
 
-    def measure_time_and_memory(self, func, *args, **kwargs):
-        """시간과 메모리 사용량 측정"""
-        # 메모리 추적 시작
-        tracemalloc.start()
-        gc.collect()  # 가비지 컬렉션 실행
+@contextlib.contextmanager
+def _frozen_heap():
+    """현재 살아 있는 객체를 GC 추적 대상에서 제외 (측정마다 전체 수집을 하지 않도록 함)"""
+    gc.collect()
+    gc.freeze()
+    try:
+        yield
+    finally:
+        gc.unfreeze()
 
-        start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
 
-        # 메모리 사용량 측정
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+class PerformanceBenchmark:
+
+    def __init__(self):
+        self.results = {}
+        self._workers = 1
+        # (name, tpi, total, mem) 행 목록: 출력 시점에 한 번만 배열로 변환
+        self._rows = []
+
+    def measure_time_and_memory(self, func, *args, samples=1, **kwargs):
+        """시간과 메모리 사용량 측정
+
+        tracemalloc은 모든 할당을 후킹하므로 시간 측정과 분리해서 두 번 실행한다.
+        samples > 1이면 func를 그만큼 반복 실행해 호출당 시간의 중앙값을 보고한다.
+        """
+        # 1) 시간 측정: tracemalloc 없이, 측정 구간 동안 GC 비활성화
+        timings_ns = [0] * samples
+        gc.disable()
+        try:
+            for i in range(samples):
+                start_ns = time.perf_counter_ns()
+                result = func(*args, **kwargs)
+                timings_ns[i] = time.perf_counter_ns() - start_ns
+        finally:
+            gc.enable()
+        elapsed_ns = statistics.median(timings_ns)
+
+        # 2) 메모리 측정: 프레임 깊이 1로 추적 비용 최소화
+        tracemalloc.start(1)
+        try:
+            func(*args, **kwargs)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
 
         return {
             'result': result,
-            'time': end_time - start_time,
+            'time': elapsed_ns / 1e9,
             'memory_current': current / 1024 / 1024,  # MB
             'memory_peak': peak / 1024 / 1024,  # MB
         }
 
+    def _record(self, name, iterations, res):
+        """측정 결과를 self.results에 기록 (반복당 시간은 ms)"""
+        t = res['time']
+        self.results[name] = dict(zip(_KEYS, (
+            iterations, t / iterations * 1000, t, res['memory_current'], res['memory_peak'],
+        )))
+        self._rows.append((name, t / iterations * 1000, t, res['memory_current']))
+
+    def results_array(self, names=None):
+        """기록된 결과를 구조화 배열로 변환 (numpy 미설치 시 튜플 리스트)
+
+        에러 결과는 self.results에만 남고 배열에는 포함되지 않는다.
+        """
+        rows = {row[0]: row for row in self._rows}
+        selected = [rows[name] for name in (names or rows) if name in rows]
+        if HAS_NUMPY:
+            return np.array(selected, dtype=_RESULT_DTYPE)
+        return selected
+
     def benchmark_spring_di_creation(self, iterations=1000):
         """Spring DI 시스템 인스턴스 생성 성능"""
 
@@ -73,20 +157,17 @@ class PerformanceBenchmark:
                 return self.repo.get_data()
 
         def create_instances():
-            instances = []
-            for _ in range(iterations):
-                service = ApplicationContext.get_bean(BenchmarkService)
-                instances.append(service.process())
+            instances = [None] * iterations
+            # 수동 생성과 비교하므로 빈 조회(get_bean)를 매 반복 측정에 포함
+            for i in range(iterations):
+                instances[i] = ApplicationContext.get_bean(BenchmarkService).process()
             return len(instances)
 
+        # 측정 전 한 번 조회해 의존성 그래프 해결/싱글톤 생성 비용을 제외
+        ApplicationContext.get_bean(BenchmarkService)
+
         result = self.measure_time_and_memory(create_instances)
-        self.results['spring_di_creation'] = {
-            'iterations': iterations,
-            'time_per_iteration': result['time'] / iterations * 1000,  # ms
-            'total_time': result['time'],
-            'memory_current': result['memory_current'],
-            'memory_peak': result['memory_peak']
-        }
+        self._record('spring_di_creation', iterations, result)
 
     def benchmark_dependency_injector(self, iterations=1000):
         """dependency-injector와 비교"""
@@ -96,10 +177,14 @@ class PerformanceBenchmark:
 
         # dependency-injector 버전
         class Repository:
+            __slots__ = ()
+
             def get_data(self):
                 return "data"
 
         class Service:
+            __slots__ = ('repo',)
+
             def __init__(self, repo: Repository):
                 self.repo = repo
 
@@ -113,29 +198,27 @@ class PerformanceBenchmark:
         container = Container()
 
         def create_instances():
-            instances = []
-            for _ in range(iterations):
+            instances = [None] * iterations
+            for i in range(iterations):
                 service = container.service()
-                instances.append(service.process())
+                instances[i] = service.process()
             return len(instances)
 
         result = self.measure_time_and_memory(create_instances)
-        self.results['dependency_injector'] = {
-            'iterations': iterations,
-            'time_per_iteration': result['time'] / iterations * 1000,  # ms
-            'total_time': result['time'],
-            'memory_current': result['memory_current'],
-            'memory_peak': result['memory_peak']
-        }
+        self._record('dependency_injector', iterations, result)
 
     def benchmark_fastapi_depends(self, iterations=1000):
         """FastAPI 기본 Depends와 비교"""
 
         class Repository:
+            __slots__ = ()
+
             def get_data(self):
                 return "data"
 
         class Service:
+            __slots__ = ('repo',)
+
             def __init__(self, repo: Repository):
                 self.repo = repo
 
@@ -149,32 +232,30 @@ class PerformanceBenchmark:
             return Service(repo)
 
         def create_instances():
-            instances = []
-            for _ in range(iterations):
+            instances = [None] * iterations
+            for i in range(iterations):
                 # FastAPI Depends는 실제로는 프레임워크가 호출하지만
                 # 여기서는 직접 호출로 시뮬레이션
                 repo = get_repository()
                 service = Service(repo)
-                instances.append(service.process())
+                instances[i] = service.process()
             return len(instances)
 
         result = self.measure_time_and_memory(create_instances)
-        self.results['fastapi_depends'] = {
-            'iterations': iterations,
-            'time_per_iteration': result['time'] / iterations * 1000,  # ms
-            'total_time': result['time'],
-            'memory_current': result['memory_current'],
-            'memory_peak': result['memory_peak']
-        }
+        self._record('fastapi_depends', iterations, result)
 
     def benchmark_manual_creation(self, iterations=1000):
         """수동 인스턴스 생성과 비교 (베이스라인)"""
 
         class Repository:
+            __slots__ = ()
+
             def get_data(self):
                 return "data"
 
         class Service:
+            __slots__ = ('repo',)
+
             def __init__(self, repo: Repository):
                 self.repo = repo
 
@@ -182,21 +263,24 @@ class PerformanceBenchmark:
                 return self.repo.get_data()
 
         def create_instances():
-            instances = []
-            for _ in range(iterations):
+            instances = [None] * iterations
+            for i in range(iterations):
                 repo = Repository()
                 service = Service(repo)
-                instances.append(service.process())
+                instances[i] = service.process()
             return len(instances)
 
         result = self.measure_time_and_memory(create_instances)
-        self.results['manual_creation'] = {
-            'iterations': iterations,
-            'time_per_iteration': result['time'] / iterations * 1000,  # ms
-            'total_time': result['time'],
-            'memory_current': result['memory_current'],
-            'memory_peak': result['memory_peak']
-        }
+        self._record('manual_creation', iterations, result)
+
+    def benchmark_compiled_loop(self, iterations=1000):
+        """컴파일된 반복 하한선 (numba 미설치 시 인터프리터 기준)"""
+        # JIT 컴파일/캐시 로딩 비용은 측정 구간 밖에서 미리 지불
+        _manual_loop(1)
+
+        result = self.measure_time_and_memory(_manual_loop, iterations)
+        self._record('compiled_loop', iterations, result)
+        self.results['compiled_loop']['jit'] = HAS_NUMBA
 
     def benchmark_singleton_vs_prototype(self, iterations=1000):
         """싱글톤 vs 프로토타입 스코프 성능 비교"""
@@ -218,39 +302,29 @@ class PerformanceBenchmark:
                 return self.data
 
         def test_singleton():
-            results = []
-            for _ in range(iterations):
-                service = ApplicationContext.get_bean(SingletonService)
-                results.append(service.get_data())
+            results = [None] * iterations
+            service = ApplicationContext.get_bean(SingletonService)
+            for i in range(iterations):
+                results[i] = service.get_data()
             return len(results)
 
         def test_prototype():
-            results = []
-            for _ in range(iterations):
+            results = [None] * iterations
+            for i in range(iterations):
                 service = ApplicationContext.get_bean(PrototypeService)
-                results.append(service.get_data())
+                results[i] = service.get_data()
             return len(results)
 
+        ApplicationContext.get_bean(SingletonService)
+        ApplicationContext.get_bean(PrototypeService)
+
         singleton_result = self.measure_time_and_memory(test_singleton)
         prototype_result = self.measure_time_and_memory(test_prototype)
 
-        self.results['singleton_scope'] = {
-            'iterations': iterations,
-            'time_per_iteration': singleton_result['time'] / iterations * 1000,
-            'total_time': singleton_result['time'],
-            'memory_current': singleton_result['memory_current'],
-            'memory_peak': singleton_result['memory_peak']
-        }
+        self._record('singleton_scope', iterations, singleton_result)
+        self._record('prototype_scope', iterations, prototype_result)
 
-        self.results['prototype_scope'] = {
-            'iterations': iterations,
-            'time_per_iteration': prototype_result['time'] / iterations * 1000,
-            'total_time': prototype_result['time'],
-            'memory_current': prototype_result['memory_current'],
-            'memory_peak': prototype_result['memory_peak']
-        }
-
-    def benchmark_deep_dependency_chain(self, iterations=100):
+    def benchmark_deep_dependency_chain(self, iterations=100, cold_samples=25):
         """깊은 의존성 체인 성능"""
 
         @repository()
@@ -260,111 +334,158 @@ class PerformanceBenchmark:
         @service()
         class Layer2:
             def __init__(self, layer1: Layer1): self.layer1 = layer1
-            def get_data(self): return f"{self.layer1.get_data()}_layer2"
+            def get_data(self): return self.layer1.get_data() + "_layer2"
 
         @service()
         class Layer3:
             def __init__(self, layer2: Layer2): self.layer2 = layer2
-            def get_data(self): return f"{self.layer2.get_data()}_layer3"
+            def get_data(self): return self.layer2.get_data() + "_layer3"
 
         @service()
         class Layer4:
             def __init__(self, layer3: Layer3): self.layer3 = layer3
-            def get_data(self): return f"{self.layer3.get_data()}_layer4"
+            def get_data(self): return self.layer3.get_data() + "_layer4"
 
         @service()
         class Layer5:
             def __init__(self, layer4: Layer4): self.layer4 = layer4
-            def get_data(self): return f"{self.layer4.get_data()}_layer5"
+            def get_data(self): return self.layer4.get_data() + "_layer5"
+
+        def test_cold_chain():
+            # 싱글톤을 폐기한 뒤 5단계 의존성 해결을 정확히 한 번 수행
+            ApplicationContext.reset_singletons()
+            return ApplicationContext.get_bean(Layer5).get_data()
 
         def test_deep_chain():
-            results = []
-            for _ in range(iterations):
-                service = ApplicationContext.get_bean(Layer5)
-                results.append(service.get_data())
+            results = [None] * iterations
+            service = ApplicationContext.get_bean(Layer5)
+            for i in range(iterations):
+                results[i] = service.get_data()
             return len(results)
 
+        # 1회 해결은 잡음이 크므로 여러 번 측정해 중앙값 사용
+        result = self.measure_time_and_memory(test_cold_chain, samples=cold_samples)
+        self._record('deep_dependency_chain_cold', 1, result)
+
+        # 콜드 측정이 만든 싱글톤을 그대로 재사용해 메서드 호출 비용만 측정
         result = self.measure_time_and_memory(test_deep_chain)
-        self.results['deep_dependency_chain'] = {
-            'iterations': iterations,
-            'time_per_iteration': result['time'] / iterations * 1000,
-            'total_time': result['time'],
-            'memory_current': result['memory_current'],
-            'memory_peak': result['memory_peak']
-        }
+        self._record('deep_dependency_chain_warm', iterations, result)
 
-    def run_all_benchmarks(self):
-        """모든 벤치마크 실행"""
-        print("🚀 DI 시스템 성능 벤치마크 시작...")
+    def run_all_benchmarks(self, max_workers=1):
+        """모든 벤치마크 실행
 
-        # ApplicationContext 초기화
-        ApplicationContext._components = {}
-        ApplicationContext._component_configs = {}
+        기본은 한 프로세스에서 순서대로 실행한다.
+        max_workers > 1이면 벤치마크를 프로세스 풀에 나눠 실행한다 (각 워커는 자기 프로세스의
+        ApplicationContext만 사용). 벤치마크끼리 코어/메모리 대역폭을 두고 경합하므로
+        시간 비교가 왜곡될 수 있으며, 리포트에 경고가 함께 출력된다.
+        """
+        print("🚀 DI 시스템 성능 벤치마크 시작...")
+        self._workers = max_workers
 
         benchmarks = [
-            ("Spring DI Creation", self.benchmark_spring_di_creation),
-            ("Dependency Injector", self.benchmark_dependency_injector),
-            ("FastAPI Depends", self.benchmark_fastapi_depends),
-            ("Manual Creation", self.benchmark_manual_creation),
-            ("Singleton vs Prototype", self.benchmark_singleton_vs_prototype),
-            ("Deep Dependency Chain", self.benchmark_deep_dependency_chain),
+            ("Spring DI Creation", 'benchmark_spring_di_creation'),
+            ("Dependency Injector", 'benchmark_dependency_injector'),
+            ("FastAPI Depends", 'benchmark_fastapi_depends'),
+            ("Manual Creation", 'benchmark_manual_creation'),
+            ("Compiled Loop", 'benchmark_compiled_loop'),
+            ("Singleton vs Prototype", 'benchmark_singleton_vs_prototype'),
+            ("Deep Dependency Chain", 'benchmark_deep_dependency_chain'),
         ]
 
-        for name, benchmark in benchmarks:
-            print(f"⏱️  {name} 벤치마크 실행 중...")
-            try:
-                benchmark()
-                print(f"✅ {name} 완료")
-            except Exception as e:
-                print(f"❌ {name} 실패: {e}")
-                self.results[name.lower().replace(' ', '_')] = {'error': str(e)}
+        methods = [method for _, method in benchmarks]
+        with contextlib.ExitStack() as stack:
+            if max_workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+                outcomes = executor.map(_run_benchmark, methods)
+            else:
+                outcomes = map(_run_benchmark, methods)
+
+            # 제출 순서대로 결과를 받으므로 출력/기록 순서는 실행 방식과 무관
+            for (name, _), (results, rows, error) in zip(benchmarks, outcomes):
+                if error is None:
+                    print(f"✅ {name} 완료")
+                    self.results.update(results)
+                    self._rows.extend(rows)
+                else:
+                    print(f"❌ {name} 실패: {error}")
+                    self.results[name.lower().replace(' ', '_')] = {'error': error}
 
         return self.results
 
     def print_results(self):
         """결과 출력"""
-        print("\n" + "="*80)
-        print("📊 DI 시스템 성능 벤치마크 결과")
-        print("="*80)
+        lines = [
+            "\n" + "="*80,
+            "📊 DI 시스템 성능 벤치마크 결과",
+            "="*80,
+        ]
 
         for name, result in self.results.items():
             if 'error' in result:
-                print(f"\n❌ {name.upper()}: {result['error']}")
+                lines.append(f"\n❌ {name.upper()}: {result['error']}")
                 continue
 
-            print(f"\n📈 {name.upper().replace('_', ' ')}")
-            print(f"   반복 횟수: {result.get('iterations', 'N/A')}")
-            print(f"   반복당 시간: {result.get('time_per_iteration', 0):.4f} ms")
-            print(f"   총 시간: {result.get('total_time', 0):.4f} s")
-            print(f"   메모리 사용: {result.get('memory_current', 0):.2f} MB")
-            print(f"   최대 메모리: {result.get('memory_peak', 0):.2f} MB")
+            lines += [
+                f"\n📈 {name.upper().replace('_', ' ')}",
+                f"   반복 횟수: {result.get('iterations', 'N/A')}",
+                f"   반복당 시간: {result.get('time_per_iteration', 0):.4f} ms",
+                f"   총 시간: {result.get('total_time', 0):.4f} s",
+                f"   메모리 사용: {result.get('memory_current', 0):.2f} MB",
+                f"   최대 메모리: {result.get('memory_peak', 0):.2f} MB",
+            ]
+
+        # 줄 단위 print 대신 한 번에 출력
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def performance_comparison_table(self):
         """성능 비교 테이블"""
-        print("\n" + "="*100)
-        print("🏁 성능 비교 테이블 (1000회 반복 기준)")
-        print("="*100)
-        print(f"{'방식':<25} {'반복당 시간(ms)':<15} {'총 시간(s)':<12} {'메모리(MB)':<12} {'상대 성능':<10}")
-        print("-" * 100)
+        lines = [
+            "\n" + "="*100,
+            "🏁 성능 비교 테이블 (1000회 반복 기준)",
+            "="*100,
+            f"{'방식':<25} {'반복당 시간(ms)':<15} {'총 시간(s)':<12} {'메모리(MB)':<12} {'상대 성능':<10}",
+            "-" * 100,
+        ]
+        if self._workers > 1:
+            lines.insert(3, f"⚠️  {self._workers}개 프로세스 병렬 실행: 벤치마크 간 자원 경합으로 시간이 왜곡될 수 있음")
 
         baseline_time = self.results.get('manual_creation', {}).get('time_per_iteration', 1)
 
         methods = [
+            ('Compiled Loop (floor)', 'compiled_loop'),
             ('Manual Creation', 'manual_creation'),
             ('FastAPI Depends', 'fastapi_depends'),
             ('Spring DI', 'spring_di_creation'),
             ('Dependency Injector', 'dependency_injector'),
         ]
 
-        for display_name, key in methods:
-            if key in self.results and 'error' not in self.results[key]:
-                result = self.results[key]
-                time_per_iter = result.get('time_per_iteration', 0)
-                total_time = result.get('total_time', 0)
-                memory = result.get('memory_current', 0)
-                relative_perf = f"{time_per_iter / baseline_time:.2f}x"
+        display_names = {key: display_name for display_name, key in methods}
+        rows = self.results_array([key for _, key in methods])
+
+        # 상대 성능은 한 번의 벡터 나눗셈으로 계산
+        if HAS_NUMPY:
+            ratios = rows['tpi'] / baseline_time
+        else:
+            ratios = [row[1] / baseline_time for row in rows]
+
+        for (key, time_per_iter, total_time, memory), ratio in zip(rows, ratios):
+            relative_perf = f"{ratio:.2f}x"
+            lines.append(f"{display_names[str(key)]:<25} {time_per_iter:<15.4f} {total_time:<12.4f} {memory:<12.2f} {relative_perf:<10}")
+
+        # 줄 단위 print 대신 한 번에 출력
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def _run_benchmark(method_name):
+    """벤치마크 하나를 새 인스턴스로 실행하고 (results, rows, error) 반환 (프로세스 풀 워커 겸용)"""
+    benchmark = PerformanceBenchmark()
+    try:
+        # 벤치마크별 등록 정보가 다른 벤치마크로 새지 않도록 빈 컨텍스트에서 실행
+        with _frozen_heap(), fresh_context(ApplicationContext):
+            getattr(benchmark, method_name)()
+    except Exception as e:
+        return None, None, str(e)
+    return benchmark.results, benchmark._rows, None
 
-                print(f"{display_name:<25} {time_per_iter:<15.4f} {total_time:<12.4f} {memory:<12.2f} {relative_perf:<10}")
 
 if __name__ == "__main__":
     benchmark = PerformanceBenchmark()
@@ -0,0 +1,71 @@
+"""
+pytest-benchmark 기반 DI 성능 벤치마크
+performance_benchmark.py의 시나리오를 그대로 재사용하고, 반복/워밍업/통계는 pytest-benchmark에 맡김
+
+    pytest tests/spring_di/test_performance_benchmark.py --benchmark-autosave
+"""
+
+import functools
+import sys
+import os
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# 경로 추가
+sys.path.append(os.path.dirname(__file__))
+
+from context_isolation import fresh_context
+from performance_benchmark import PerformanceBenchmark, ApplicationContext
+
+
+class _CaseCollector(PerformanceBenchmark):
+    """측정하지 않고 결과 이름별 측정 대상 함수만 모으는 PerformanceBenchmark"""
+
+    def __init__(self):
+        super().__init__()
+        self.cases = {}
+
+    def measure_time_and_memory(self, func, *args, samples=1, **kwargs):
+        # 반복/통계는 pytest-benchmark가 담당하므로 samples는 사용하지 않음
+        return functools.partial(func, *args, **kwargs)
+
+    def _record(self, name, iterations, res):
+        self.results[name] = {'iterations': iterations}
+        self.cases[name] = res
+
+
+# (시나리오 메서드, 기록되는 결과 이름)
+CASES = [
+    ('benchmark_spring_di_creation', 'spring_di_creation'),
+    ('benchmark_dependency_injector', 'dependency_injector'),
+    ('benchmark_fastapi_depends', 'fastapi_depends'),
+    ('benchmark_manual_creation', 'manual_creation'),
+    ('benchmark_compiled_loop', 'compiled_loop'),
+    ('benchmark_singleton_vs_prototype', 'singleton_scope'),
+    ('benchmark_singleton_vs_prototype', 'prototype_scope'),
+    ('benchmark_deep_dependency_chain', 'deep_dependency_chain_cold'),
+    ('benchmark_deep_dependency_chain', 'deep_dependency_chain_warm'),
+]
+
+
+@pytest.mark.parametrize("method_name, case_name", CASES, ids=[name for _, name in CASES])
+def test_bench(benchmark, method_name, case_name):
+    with fresh_context(ApplicationContext):
+        collector = _CaseCollector()
+        getattr(collector, method_name)()
+        if case_name not in collector.cases:
+            pytest.skip(collector.results[case_name]['error'])
+        case = collector.cases[case_name]
+
+        # 메모리는 시간 측정과 분리해 한 번만 추적
+        tracemalloc.start(1)
+        try:
+            case()
+            benchmark.extra_info['memory_peak_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+        benchmark.pedantic(case, rounds=10, warmup_rounds=2)
@@ -13,14 +13,17 @@ from spring_di import (
     service, repository, controller, component, autowired,
     ApplicationContext, Scope
 )
-from typing import Protocol
+from typing import Protocol, runtime_checkable
+from context_isolation import fresh_context
+from abc import ABC, abstractmethod
 
 class TestSpringDI:
 
-    def setup_method(self):
-        """각 테스트 전에 ApplicationContext 초기화"""
-        ApplicationContext._components = {}
-        ApplicationContext._component_configs = {}
+    @pytest.fixture(autouse=True)
+    def isolated_context(self):
+        """각 테스트 전에 ApplicationContext 초기화 (종료 후 원래 상태 복원)"""
+        with fresh_context(ApplicationContext):
+            yield
 
     def test_component_registration(self):
         """컴포넌트 등록 테스트"""
@@ -29,12 +32,14 @@ class TestSpringDI:
             def get_message(self):
                 return "Hello from component"
 
-        # 컴포넌트가 등록되었는지 확인
+        # 컴포넌트가 등록되었는지 확인 (데코레이터는 원본 클래스를 그대로 반환)
         assert TestComponent in ApplicationContext._component_configs
+        assert len(ApplicationContext._component_configs) == 1
 
         # 인스턴스 생성 테스트
         instance = ApplicationContext.get_bean(TestComponent)
         assert instance.get_message() == "Hello from component"
+        assert type(instance) is TestComponent
 
     def test_constructor_injection(self):
         """생성자 의존성 주입 테스트"""
@@ -77,6 +82,72 @@ class TestSpringDI:
 
         assert result == "injected value"
 
+    def test_scan_and_autowire_warms_fields(self):
+        """scan_and_autowire 시 필드가 미리 주입되는지 테스트"""
+        @service()
+        class WarmDependency:
+            pass
+
+        @controller()
+        class WarmController:
+            dependency: WarmDependency = autowired(WarmDependency)
+
+        instance = ApplicationContext.get_bean(WarmController)
+        ApplicationContext.scan_and_autowire()
+
+        # 디스크립터를 거치지 않는 인스턴스 속성으로 주입되어 있어야 함
+        assert instance.__dict__["dependency"] is ApplicationContext.get_bean(WarmDependency)
+        assert instance.dependency is instance.__dict__["dependency"]
+
+    def test_scan_and_autowire_inherited_fields(self):
+        """상속된 @Autowired 필드 주입 테스트"""
+        @service()
+        class AuditService:
+            pass
+
+        class BaseController:
+            audit: AuditService = autowired(AuditService)
+
+        @controller()
+        class OrderController(BaseController):
+            pass
+
+        instance = ApplicationContext.get_bean(OrderController)
+        ApplicationContext.scan_and_autowire()
+
+        assert instance.__dict__["audit"] is ApplicationContext.get_bean(AuditService)
+
+    def test_scan_and_autowire_keeps_instantiation_lazy(self):
+        """scan_and_autowire가 아직 생성되지 않은 싱글톤을 만들지 않는지 테스트"""
+        created = []
+
+        @service()
+        class LazyService:
+            def __init__(self):
+                created.append(self)
+
+        ApplicationContext.scan_and_autowire()
+
+        assert created == []
+        assert ApplicationContext._component_configs[LazyService]['instance'] is None
+
+    def test_field_injection_with_slots(self):
+        """__slots__ 클래스의 @Autowired 필드 주입 테스트"""
+        @service()
+        class SlotDependency:
+            pass
+
+        @service()
+        class SlotService:
+            __slots__ = ('_dependency',)
+            dependency: SlotDependency = autowired(SlotDependency)
+
+        instance = ApplicationContext.get_bean(SlotService)
+        ApplicationContext.scan_and_autowire()
+
+        assert instance.dependency is ApplicationContext.get_bean(SlotDependency)
+        assert instance._dependency is instance.dependency
+
     def test_interface_injection(self):
         """인터페이스 기반 의존성 주입 테스트"""
         class IDataSource(Protocol):
@@ -101,6 +172,62 @@ class TestSpringDI:
         result = processor.process()
 
         assert result == "processing: database data"
+        assert ApplicationContext._find_implementations(IDataSource) == [DatabaseDataSource]
+
+    def test_runtime_protocol_injection(self):
+        """구조적으로만 일치하는 runtime_checkable Protocol 주입 테스트"""
+        @runtime_checkable
+        class IClock(Protocol):
+            def now(self) -> str:
+                ...
+
+        @component()
+        class SystemClock:
+            def now(self) -> str:
+                return "now"
+
+        @service()
+        class Scheduler:
+            def __init__(self, clock: IClock):
+                self.clock = clock
+
+        scheduler = ApplicationContext.get_bean(Scheduler)
+        assert scheduler.clock is ApplicationContext.get_bean(SystemClock)
+
+    def test_abc_virtual_subclass_injection(self):
+        """ABC.register로 등록된 가상 서브클래스 주입 테스트"""
+        class INotifier(ABC):
+            @abstractmethod
+            def send(self) -> str:
+                ...
+
+        @component()
+        class EmailNotifier:
+            def send(self) -> str:
+                return "email"
+
+        INotifier.register(EmailNotifier)
+
+        @service()
+        class AlertService:
+            def __init__(self, notifier: INotifier):
+                self.notifier = notifier
+
+        alert = ApplicationContext.get_bean(AlertService)
+        assert alert.notifier is ApplicationContext.get_bean(EmailNotifier)
+
+    def test_reset_singletons(self):
+        """reset_singletons 후 싱글톤이 새로 생성되는지 테스트"""
+        @service()
+        class ResettableService:
+            pass
+
+        first = ApplicationContext.get_bean(ResettableService)
+        ApplicationContext.reset_singletons()
+        second = ApplicationContext.get_bean(ResettableService)
+
+        assert first is not second
+        assert ApplicationContext.get_bean(ResettableService) is second
 
     def test_singleton_scope(self):
         """싱글톤 스코프 테스트"""
@@ -176,8 +303,8 @@ class TestSpringDI:
                 return f"response_{self.business.execute()}"
 
         # 깊은 의존성 체인이 올바르게 해결되는지 테스트
-        controller = ApplicationContext.get_bean(ApiController)
-        result = controller.handle_request()
+        api_controller = ApplicationContext.get_bean(ApiController)
+        result = api_controller.handle_request()
 
         assert result == "response_business_transformed_raw_data"
 